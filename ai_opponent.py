@@ -1,31 +1,36 @@
 import random
-from .ai_strategy import AIStrategy, EasyAIStrategy, MediumAIStrategy, HardAIStrategy
+from .ai_strategy import AIStrategy, EasyAIStrategy, MediumAIStrategy, HardAIStrategy, _OPP
+
+
+# Strategies hold no per-game state, so one shared instance per
+# difficulty serves every game and difficulty switch
+_STRATEGY_INSTANCES = {
+    'easy': EasyAIStrategy(),
+    'medium': MediumAIStrategy(),
+    'hard': HardAIStrategy(),
+}
 
 
 class AIStrategyFactory:
     """Factory for creating AI strategy objects based on difficulty"""
-    
+
     def create_strategy(self, difficulty):
         """
         Create and return an AI strategy based on difficulty
-        
+
         Args:
             difficulty (str): Difficulty level ('easy', 'medium', 'hard')
-            
+
         Returns:
             AIStrategy: The appropriate strategy object
-            
+
         Raises:
             ValueError: If an invalid difficulty is provided
         """
-        if difficulty.lower() == 'easy':
-            return EasyAIStrategy()
-        elif difficulty.lower() == 'medium':
-            return MediumAIStrategy()
-        elif difficulty.lower() == 'hard':
-            return HardAIStrategy()
-        else:
+        strategy = _STRATEGY_INSTANCES.get(difficulty.lower())
+        if strategy is None:
             raise ValueError(f"Invalid difficulty level: {difficulty}")
+        return strategy
 
 
 class AIPersonality:
@@ -56,7 +61,15 @@ class AIPersonality:
             (1, 2): 1.0,
             (2, 1): 1.0
         }
-    
+
+        # Precompute inverse weights as a flat table indexed by x*3+y so
+        # sampling does one index load instead of a dict lookup and a
+        # division per candidate
+        self._inverse_preferences = tuple(
+            1.0 / self.move_preferences.get((x, y), 1.0)
+            for x in range(3) for y in range(3)
+        )
+
     def should_make_suboptimal_move(self):
         """
         Determine if AI should make a suboptimal move in this turn
@@ -80,30 +93,22 @@ class AIPersonality:
         empty_cells = board.get_empty_cells()
         if len(empty_cells) <= 1:
             return suggested_move  # Only one option, can't be suboptimal
-        
-        # Remove the suggested (optimal) move from candidates
-        suboptimal_candidates = [move for move in empty_cells if move != suggested_move]
-        
-        if not suboptimal_candidates:
-            return suggested_move
-        
-        # Weight the candidates by position preference
-        weighted_candidates = []
-        for move in suboptimal_candidates:
-            weight = self.move_preferences.get((move.x, move.y), 1.0)
-            weighted_candidates.append((move, weight))
-        
-        # Choose based on weights
-        total_weight = sum(w for _, w in weighted_candidates)
-        r = random.uniform(0, total_weight)
-        upto = 0
-        for move, weight in weighted_candidates:
-            upto += weight
-            if upto >= r:
-                return move
-        
-        # Fallback
-        return random.choice(suboptimal_candidates)
+
+        # Weighted pick via A-Res reservoir sampling (Efraimidis-Spirakis):
+        # each candidate gets the key random()**(1/w) and the largest key
+        # wins. Single pass, no candidate list or total-weight pre-sum.
+        best_move = None
+        best_key = -1.0
+        inverse_preferences = self._inverse_preferences
+        for move in empty_cells:
+            if move == suggested_move:
+                continue  # Skip the optimal move, we want a suboptimal one
+            key = random.random() ** inverse_preferences[move.x * 3 + move.y]
+            if key > best_key:
+                best_key = key
+                best_move = move
+
+        return best_move if best_move is not None else suggested_move
 
 
 class AIOpponent:
@@ -119,7 +124,7 @@ class AIOpponent:
         """
         self.difficulty_level = difficulty
         self.player_mark = player_mark
-        self.ai_mark = 'O' if player_mark == 'X' else 'X'
+        self.ai_mark = _OPP[player_mark]
         self.strategy_factory = AIStrategyFactory()
         self.strategy = self.strategy_factory.create_strategy(difficulty)
         self.personality = AIPersonality(randomness_factor=0.1)
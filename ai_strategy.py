@@ -1,6 +1,11 @@
 import random
 from abc import ABC, abstractmethod
 
+from .models import Move, WIN_MASKS, FULL_BOARD
+
+# Opposing mark lookup, shared by the strategies, opponent and engine
+_OPP = {'X': 'O', 'O': 'X'}
+
 class AIStrategy(ABC):
     """Abstract base class for AI strategies"""
     
@@ -63,8 +68,8 @@ class MediumAIStrategy(AIStrategy):
             Move: Best move according to medium difficulty strategy
         """
         # Get opponent's mark
-        opponent_mark = 'O' if mark == 'X' else 'X'
-        
+        opponent_mark = _OPP[mark]
+
         # Check if AI can win in the next move
         winning_move = self._find_winning_move(board, mark)
         if winning_move:
@@ -76,7 +81,7 @@ class MediumAIStrategy(AIStrategy):
             return blocking_move
         
         # Take center if available
-        center = Move(1, 1)
+        center = Move.of(1, 1)
         if board.is_cell_empty(center.x, center.y):
             return center
         
@@ -99,7 +104,7 @@ class MediumAIStrategy(AIStrategy):
             Move or None: Winning move if exists, None otherwise
         """
         # Try each empty cell and see if it results in a win
-        for move in board.get_empty_cells():
+        for move in board.iter_empty_cells():
             # Make the move
             board.make_move(move, mark)
             
@@ -120,87 +125,216 @@ class HardAIStrategy(AIStrategy):
     Hard difficulty AI using the minimax algorithm with alpha-beta pruning
     for optimal move selection
     """
-    
+
+    # Whether the full-game policy table has been built yet
+    _policy_built = False
+
+    def __init__(self):
+        """Initialize the strategy, building the policy table on first use"""
+        self._ensure_policy()
+
+    @classmethod
+    def _ensure_policy(cls):
+        """
+        Build the full minimax policy table once per process
+
+        The tic-tac-toe state space is tiny (<5500 reachable positions),
+        so a single solve of the empty board populates the optimal move
+        for every position the game can reach.
+        """
+        if not cls._policy_built:
+            _solve(0, 0)
+            cls._policy_built = True
+
     def find_best_move(self, board, mark):
         """
         Find optimal move using minimax algorithm with alpha-beta pruning
-        
+
         Args:
             board (Board): Current game board
             mark (str): AI's mark ('X' or 'O')
-            
+
         Returns:
             Move: Optimal move
         """
-        # Get opponent's mark
-        opponent_mark = 'O' if mark == 'X' else 'X'
-        
+        # Fast path: look the position up in the precomputed policy.
+        # The table is keyed by state; the side to move follows from the
+        # mark counts, so it only applies when it is actually our turn.
+        x_mask, o_mask = board.x_mask, board.o_mask
+        x_to_move = x_mask.bit_count() == o_mask.bit_count()
+        if (mark == 'X') == x_to_move:
+            index = _POLICY.get((x_mask, o_mask))
+            if index is not None:
+                return Move.of(index // 3, index % 3)
+
+        # Fallback: direct search for states the policy does not cover
+        if mark == 'X':
+            ai_mask, opponent_mask = x_mask, o_mask
+        else:
+            ai_mask, opponent_mask = o_mask, x_mask
+
         best_score = float('-inf')
         best_move = None
-        
-        # Try each empty cell
-        for move in board.get_empty_cells():
-            # Make the move
-            board.make_move(move, mark)
-            
-            # Recursively evaluate the position
-            score = self._minimax(board, 0, False, mark, opponent_mark, float('-inf'), float('inf'))
-            
-            # Undo the move
-            board.undo_move(move)
-            
+
+        # Try each empty cell, strongest first
+        empty = ~(ai_mask | opponent_mask) & FULL_BOARD
+        for bit in _ORDERED_BITS:
+            if not empty & bit:
+                continue
+
+            # Recursively evaluate the position with the move applied
+            score = _minimax(ai_mask | bit, opponent_mask, False, float('-inf'), float('inf'))
+
             # Update best score and move
             if score > best_score:
                 best_score = score
-                best_move = move
-        
+                index = bit.bit_length() - 1
+                best_move = Move.of(index // 3, index % 3)
+
         return best_move
-    
-    def _minimax(self, board, depth, is_maximizing, ai_mark, opponent_mark, alpha, beta):
-        """
-        Minimax algorithm with alpha-beta pruning
-        
-        Args:
-            board (Board): Current game board state
-            depth (int): Current depth in the search tree
-            is_maximizing (bool): Whether current player is maximizing
-            ai_mark (str): AI's mark
-            opponent_mark (str): Opponent's mark
-            alpha (float): Alpha value for pruning
-            beta (float): Beta value for pruning
-            
-        Returns:
-            int: Evaluation score of the position
-        """
-        # Terminal state checks
-        if board.check_win(ai_mark):
-            return 10 - depth  # Win is good, quicker wins are better
-        
-        if board.check_win(opponent_mark):
-            return depth - 10  # Loss is bad, but later losses are better
-        
-        if board.check_draw():
-            return 0  # Draw
-        
-        if is_maximizing:
-            max_eval = float('-inf')
-            for move in board.get_empty_cells():
-                board.make_move(move, ai_mark)
-                eval = self._minimax(board, depth + 1, False, ai_mark, opponent_mark, alpha, beta)
-                board.undo_move(move)
-                max_eval = max(max_eval, eval)
-                alpha = max(alpha, eval)
-                if beta <= alpha:
-                    break  # Beta cutoff
-            return max_eval
+
+
+# Cell bits in strong-move-first order (center, corners, then edges).
+# Trying strong cells first gives alpha-beta an early tight bound and
+# triggers far more cutoffs than natural (x, y) order.
+_ORDERED_BITS = tuple(1 << index for index in (4, 0, 2, 6, 8, 1, 3, 5, 7))
+
+# Optimal move (bit index 0-8) for the side to move, keyed on state
+_POLICY = {}
+
+# Memoized _solve scores, keyed on state
+_SCORES = {}
+
+
+def _solve(x_mask, o_mask):
+    """
+    Memoized full-tree minimax used to build the policy table
+
+    Scores are from X's perspective and biased by the total number of
+    marks on the board, which preserves the "quicker wins / later
+    losses are better" ordering while keeping the score a pure function
+    of the state. Every non-terminal node records the best move for the
+    side to move in _POLICY.
+
+    Args:
+        x_mask (int): Bitboard of X's marks
+        o_mask (int): Bitboard of O's marks
+
+    Returns:
+        int: Evaluation score of the position from X's perspective
+    """
+    key = (x_mask, o_mask)
+    cached = _SCORES.get(key)
+    if cached is not None:
+        return cached
+
+    # Terminal state checks
+    occupied = x_mask | o_mask
+    score = None
+    for win in WIN_MASKS:
+        if (x_mask & win) == win:
+            score = 10 - occupied.bit_count()
+            break
+        if (o_mask & win) == win:
+            score = occupied.bit_count() - 10
+            break
+    if score is None and occupied == FULL_BOARD:
+        score = 0
+    if score is not None:
+        _SCORES[key] = score
+        return score
+
+    # X moves when the mark counts are level, O otherwise
+    x_to_move = x_mask.bit_count() == o_mask.bit_count()
+    best_score = None
+    best_bit = None
+    empty = ~occupied & FULL_BOARD
+    while empty:
+        bit = empty & -empty
+        empty ^= bit
+        if x_to_move:
+            child = _solve(x_mask | bit, o_mask)
+            if best_score is None or child > best_score:
+                best_score, best_bit = child, bit
         else:
-            min_eval = float('inf')
-            for move in board.get_empty_cells():
-                board.make_move(move, opponent_mark)
-                eval = self._minimax(board, depth + 1, True, ai_mark, opponent_mark, alpha, beta)
-                board.undo_move(move)
-                min_eval = min(min_eval, eval)
-                beta = min(beta, eval)
-                if beta <= alpha:
-                    break  # Alpha cutoff
-            return min_eval
\ No newline at end of file
+            child = _solve(x_mask, o_mask | bit)
+            if best_score is None or child < best_score:
+                best_score, best_bit = child, bit
+
+    _SCORES[key] = best_score
+    _POLICY[key] = best_bit.bit_length() - 1
+    return best_score
+
+
+# Transposition table for _minimax: exact scores keyed on
+# (ai_mask, opponent_mask, is_maximizing)
+_TRANSPOSITIONS = {}
+
+
+def _minimax(ai_mask, opponent_mask, is_maximizing, alpha, beta):
+    """
+    Minimax algorithm with alpha-beta pruning over bitboards
+
+    Operates purely on the two 9-bit masks so the recursion touches no
+    Board or Move objects — only integer ops per node. Positions reached
+    through different move orders are solved once and served from the
+    transposition table afterwards; scores are biased by the total mark
+    count (not search depth) so they are a pure function of the state
+    and the table stays valid across searches. The quicker-wins /
+    later-losses preference this encodes is unchanged.
+
+    Args:
+        ai_mask (int): Bitboard of the AI's marks
+        opponent_mask (int): Bitboard of the opponent's marks
+        is_maximizing (bool): Whether current player is maximizing
+        alpha (float): Alpha value for pruning
+        beta (float): Beta value for pruning
+
+    Returns:
+        int: Evaluation score of the position
+    """
+    key = (ai_mask, opponent_mask, is_maximizing)
+    cached = _TRANSPOSITIONS.get(key)
+    if cached is not None:
+        return cached
+
+    # Terminal state checks
+    occupied = ai_mask | opponent_mask
+    for win in WIN_MASKS:
+        if (ai_mask & win) == win:
+            return 10 - occupied.bit_count()  # Quicker wins are better
+        if (opponent_mask & win) == win:
+            return occupied.bit_count() - 10  # Later losses are better
+
+    empty = ~occupied & FULL_BOARD
+    if not empty:
+        return 0  # Draw
+
+    entry_alpha = alpha
+    entry_beta = beta
+    if is_maximizing:
+        best = float('-inf')
+        for bit in _ORDERED_BITS:
+            if not empty & bit:
+                continue
+            eval = _minimax(ai_mask | bit, opponent_mask, False, alpha, beta)
+            best = max(best, eval)
+            alpha = max(alpha, eval)
+            if beta <= alpha:
+                break  # Beta cutoff
+    else:
+        best = float('inf')
+        for bit in _ORDERED_BITS:
+            if not empty & bit:
+                continue
+            eval = _minimax(ai_mask, opponent_mask | bit, True, alpha, beta)
+            best = min(best, eval)
+            beta = min(beta, eval)
+            if beta <= alpha:
+                break  # Alpha cutoff
+
+    # Only scores searched with a full window are exact; cutoff results
+    # are bounds and must not be reused as values
+    if entry_alpha < best < entry_beta:
+        _TRANSPOSITIONS[key] = best
+    return best
\ No newline at end of file
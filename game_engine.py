@@ -1,5 +1,6 @@
 from .models import Board, Move
 from .ai_opponent import AIOpponent
+from .ai_strategy import _OPP
 
 class GameEngine:
     """
@@ -34,7 +35,7 @@ class GameEngine:
         # Initialize game state
         self.board = Board()
         self.player_mark = player_mark
-        self.ai_mark = 'O' if player_mark == 'X' else 'X'
+        self.ai_mark = _OPP[player_mark]
         self.ai_opponent = AIOpponent(difficulty=difficulty, player_mark=player_mark)
         
         # X always goes first in Tic-Tac-Toe
@@ -145,7 +146,7 @@ class GameEngine:
             self.game_status = "draw"
         # Game continues, switch current player
         else:
-            self.current_player = 'O' if self.current_player == 'X' else 'X'
+            self.current_player = _OPP[self.current_player]
     
     def _get_winning_line(self):
         """
@@ -159,6 +160,62 @@ class GameEngine:
             return [move.to_json() for move in winning_line]
         return None
     
+    def to_state(self):
+        """
+        Serialize the engine to a compact JSON-safe dict
+
+        The board is stored as its two 9-bit masks straight off the
+        bitboard, so the whole state is a handful of scalars — no
+        string packing or grid walk on the way in or out.
+
+        Returns:
+            dict: Minimal state needed to rebuild the engine
+        """
+        board = self.board
+        return {
+            'x': board.x_mask if board is not None else None,
+            'o': board.o_mask if board is not None else None,
+            'player_mark': self.player_mark,
+            'current_player': self.current_player,
+            'game_status': self.game_status,
+            'difficulty': self.ai_opponent.difficulty_level if self.ai_opponent else None,
+            'randomness': self.ai_opponent.personality.randomness_factor if self.ai_opponent else None
+        }
+
+    @classmethod
+    def from_state(cls, state):
+        """
+        Rebuild an engine from a dict produced by to_state
+
+        Args:
+            state (dict): Serialized engine state
+
+        Returns:
+            GameEngine: Engine restored to the saved state
+        """
+        engine = cls()
+        engine.game_status = state['game_status']
+        engine.current_player = state['current_player']
+
+        player_mark = state['player_mark']
+        if player_mark:
+            engine.player_mark = player_mark
+            engine.ai_mark = _OPP[player_mark]
+            engine.ai_opponent = AIOpponent(
+                difficulty=state['difficulty'] or 'medium',
+                player_mark=player_mark
+            )
+            if state['randomness'] is not None:
+                engine.ai_opponent.set_personality(state['randomness'])
+
+        if state['x'] is not None:
+            board = Board()
+            board.x_mask = state['x']
+            board.o_mask = state['o']
+            engine.board = board
+
+        return engine
+
     def get_board(self):
         """
         Get the current board state
@@ -1,12 +1,12 @@
-import random
-from abc import ABC, abstractmethod
 from django.db import models
 from django.contrib.auth.models import User
 from django.core.validators import MinValueValidator, MaxValueValidator
 
 class Move:
     """Represents a position on the game board"""
-    
+
+    __slots__ = ('x', 'y')
+
     def __init__(self, x, y):
         """
         Initialize a move with coordinates
@@ -75,186 +75,314 @@ class Move:
         """
         return cls(data['x'], data['y'])
 
+    @classmethod
+    def of(cls, x, y):
+        """
+        Get the shared Move instance for the given coordinates
+
+        Moves are value objects (equality and hash only depend on the
+        coordinates), so hot paths reuse the 9 cached instances instead
+        of allocating a fresh object per board cell visited.
+
+        Args:
+            x (int): X coordinate (0-2)
+            y (int): Y coordinate (0-2)
+
+        Returns:
+            Move: Cached move instance for (x, y)
+        """
+        return _MOVES[x][y]
+
+
+# Flyweight table of the 9 possible moves, shared via Move.of
+_MOVES = [[Move(x, y) for y in range(3)] for x in range(3)]
+
+# The same flyweights flattened by bit index (x*3 + y)
+_MOVES_BY_INDEX = tuple(_MOVES[index // 3][index % 3] for index in range(9))
+
+
+# The 8 winning lines encoded as 9-bit masks (bit index = x*3 + y)
+WIN_MASKS = (
+    0b000000111,  # Rows
+    0b000111000,
+    0b111000000,
+    0b001001001,  # Columns
+    0b010010010,
+    0b100100100,
+    0b100010001,  # Diagonals
+    0b001010100,
+)
+
+# Mask with all 9 cells occupied
+FULL_BOARD = 0x1FF
+
+# Move triples for each winning line, precomputed so get_winning_line
+# returns a cached list instead of rebuilding one per call
+_WIN_LINES = tuple(
+    [Move.of(i // 3, i % 3) for i in range(9) if win >> i & 1]
+    for win in WIN_MASKS
+)
+
 
 class Board:
     """Represents the Tic-Tac-Toe game board state"""
-    
+
     def __init__(self, grid=None):
         """
         Initialize the board with an empty grid or provided state
-        
+
+        The state is held as two 9-bit integers (one per mark) so that
+        move making, win checks and emptiness tests are single integer
+        operations on the minimax hot path.
+
         Args:
             grid (list[list[str]], optional): 3x3 grid with cell values
         """
-        # Initialize empty grid if none provided
-        if grid is None:
-            self.grid = [[''] * 3 for _ in range(3)]
-        else:
-            # Validate and copy the provided grid
+        # Start from empty bitboards if no grid provided
+        self.x_mask = 0
+        self.o_mask = 0
+
+        if grid is not None:
+            # Validate and fold the provided grid into the bitboards
             if len(grid) != 3 or any(len(row) != 3 for row in grid):
                 raise ValueError("Grid must be 3x3")
-            self.grid = [row[:] for row in grid]  # Deep copy
-    
+            for x in range(3):
+                for y in range(3):
+                    cell = grid[x][y]
+                    if cell == 'X':
+                        self.x_mask |= 1 << (x * 3 + y)
+                    elif cell == 'O':
+                        self.o_mask |= 1 << (x * 3 + y)
+
+    @property
+    def grid(self):
+        """
+        Derived 3x3 grid view of the bitboard state
+
+        Returns:
+            list[list[str]]: Fresh 3x3 grid with cell values
+        """
+        # Fill a flat 9-slot scratch list (touching only the set bits)
+        # and slice it into rows — cheaper than 9 per-cell bit probes
+        cells = [''] * 9
+        bits = self.x_mask
+        while bits:
+            bit = bits & -bits
+            bits ^= bit
+            cells[bit.bit_length() - 1] = 'X'
+        bits = self.o_mask
+        while bits:
+            bit = bits & -bits
+            bits ^= bit
+            cells[bit.bit_length() - 1] = 'O'
+        return [cells[0:3], cells[3:6], cells[6:9]]
+
     def get_empty_cells(self):
         """
         Get all empty cells on the board
-        
+
         Returns:
             list[Move]: List of empty cell positions
         """
-        empty_cells = []
-        for x in range(3):
-            for y in range(3):
-                if self.grid[x][y] == '':
-                    empty_cells.append(Move(x, y))
-        return empty_cells
-    
+        occupied = self.x_mask | self.o_mask
+        return [
+            move for index, move in enumerate(_MOVES_BY_INDEX)
+            if not occupied >> index & 1
+        ]
+
+    def iter_empty_cells(self):
+        """
+        Iterate over empty cells without materializing a list
+
+        Preferred over get_empty_cells for callers that may exit early
+        (e.g. searching for an immediate winning move).
+
+        Yields:
+            Move: Next empty cell position
+        """
+        empty = ~(self.x_mask | self.o_mask) & FULL_BOARD
+        while empty:
+            bit = empty & -empty
+            empty ^= bit
+            index = bit.bit_length() - 1
+            yield Move.of(index // 3, index % 3)
+
     def is_cell_empty(self, x, y):
         """
         Check if a cell is empty
-        
+
         Args:
             x (int): X coordinate (0-2)
             y (int): Y coordinate (0-2)
-            
+
         Returns:
             bool: True if the cell is empty, False otherwise
-            
+
         Raises:
             ValueError: If coordinates are out of bounds
         """
         if not (0 <= x < 3 and 0 <= y < 3):
             raise ValueError(f"Coordinates ({x}, {y}) out of bounds")
-        
-        return self.grid[x][y] == ''
-    
+
+        return not (self.x_mask | self.o_mask) >> (x * 3 + y) & 1
+
     def make_move(self, move, mark):
         """
         Place a mark on the board at the specified position
-        
+
         Args:
             move (Move): Position to place mark
             mark (str): Mark to place ('X' or 'O')
-            
+
         Returns:
             bool: True if move was valid and made, False otherwise
-            
+
         Raises:
             ValueError: If coordinates are out of bounds or cell is occupied
         """
-        if not (0 <= move.x < 3 and 0 <= move.y < 3):
-            raise ValueError(f"Coordinates ({move.x}, {move.y}) out of bounds")
-        
-        if self.grid[move.x][move.y] != '':
-            raise ValueError(f"Cell ({move.x}, {move.y}) is already occupied")
-        
-        self.grid[move.x][move.y] = mark
+        x = move.x
+        y = move.y
+        if not (0 <= x < 3 and 0 <= y < 3):
+            raise ValueError(f"Coordinates ({x}, {y}) out of bounds")
+
+        bit = 1 << (x * 3 + y)
+        if (self.x_mask | self.o_mask) & bit:
+            raise ValueError(f"Cell ({x}, {y}) is already occupied")
+
+        if mark == 'X':
+            self.x_mask |= bit
+        else:
+            self.o_mask |= bit
         return True
-    
+
     def undo_move(self, move):
         """
         Undo a move by clearing the specified cell
-        
+
         Args:
             move (Move): Position to clear
-            
+
         Raises:
             ValueError: If coordinates are out of bounds
         """
-        if not (0 <= move.x < 3 and 0 <= move.y < 3):
-            raise ValueError(f"Coordinates ({move.x}, {move.y}) out of bounds")
-        
-        self.grid[move.x][move.y] = ''
-    
+        x = move.x
+        y = move.y
+        if not (0 <= x < 3 and 0 <= y < 3):
+            raise ValueError(f"Coordinates ({x}, {y}) out of bounds")
+
+        bit = 1 << (x * 3 + y)
+        self.x_mask &= ~bit
+        self.o_mask &= ~bit
+
     def check_win(self, mark):
         """
         Check if the specified mark has won
-        
+
         Args:
             mark (str): Mark to check ('X' or 'O')
-            
+
         Returns:
             bool: True if the mark has won, False otherwise
         """
-        # Check rows
-        for row in self.grid:
-            if all(cell == mark for cell in row):
-                return True
-        
-        # Check columns
-        for col in range(3):
-            if all(self.grid[row][col] == mark for row in range(3)):
-                return True
-        
-        # Check diagonals
-        if all(self.grid[i][i] == mark for i in range(3)):
-            return True
-        
-        if all(self.grid[i][2-i] == mark for i in range(3)):
-            return True
-        
-        return False
-    
+        mask = self.x_mask if mark == 'X' else self.o_mask
+        # Unrolled scan of WIN_MASKS: no generator frame per call
+        return (
+            (mask & 0b000000111) == 0b000000111  # Rows
+            or (mask & 0b000111000) == 0b000111000
+            or (mask & 0b111000000) == 0b111000000
+            or (mask & 0b001001001) == 0b001001001  # Columns
+            or (mask & 0b010010010) == 0b010010010
+            or (mask & 0b100100100) == 0b100100100
+            or (mask & 0b100010001) == 0b100010001  # Diagonals
+            or (mask & 0b001010100) == 0b001010100
+        )
+
     def check_draw(self):
         """
         Check if the game is a draw (all cells filled with no winner)
-        
+
         Returns:
             bool: True if game is a draw, False otherwise
         """
         # If board is full and no one has won, it's a draw
-        return all(self.grid[x][y] != '' for x in range(3) for y in range(3))
-    
+        return (self.x_mask | self.o_mask) == FULL_BOARD
+
+    def evaluate(self, ai_mark):
+        """
+        Evaluate the terminal state of the board in a single pass
+
+        Fuses check_win for both marks and check_draw into one scan of
+        the winning lines, for callers that would otherwise walk the
+        board three times.
+
+        Args:
+            ai_mark (str): Mark to score the position for ('X' or 'O')
+
+        Returns:
+            int or None: 10 if ai_mark has won, -10 if the opponent has
+                won, 0 for a draw, None if the game is still running
+        """
+        if ai_mark == 'X':
+            ai_mask, opponent_mask = self.x_mask, self.o_mask
+        else:
+            ai_mask, opponent_mask = self.o_mask, self.x_mask
+
+        for win in WIN_MASKS:
+            if (ai_mask & win) == win:
+                return 10
+            if (opponent_mask & win) == win:
+                return -10
+
+        if (ai_mask | opponent_mask) == FULL_BOARD:
+            return 0
+
+        return None
+
     def is_game_over(self):
         """
         Check if the game is over (win or draw)
-        
+
         Returns:
             bool: True if game is over, False otherwise
         """
-        return self.check_win('X') or self.check_win('O') or self.check_draw()
-    
+        # One fused scan instead of two win checks plus a draw check
+        return self.evaluate('X') is not None
+
     def get_winning_line(self):
         """
         Get the winning line if there is one
-        
+
         Returns:
             list[Move] or None: List of positions forming winning line, or None if no win
         """
-        # Check rows
-        for row in range(3):
-            if self.grid[row][0] != '' and self.grid[row][0] == self.grid[row][1] == self.grid[row][2]:
-                return [Move(row, 0), Move(row, 1), Move(row, 2)]
-        
-        # Check columns
-        for col in range(3):
-            if self.grid[0][col] != '' and self.grid[0][col] == self.grid[1][col] == self.grid[2][col]:
-                return [Move(0, col), Move(1, col), Move(2, col)]
-        
-        # Check diagonals
-        if self.grid[0][0] != '' and self.grid[0][0] == self.grid[1][1] == self.grid[2][2]:
-            return [Move(0, 0), Move(1, 1), Move(2, 2)]
-        
-        if self.grid[0][2] != '' and self.grid[0][2] == self.grid[1][1] == self.grid[2][0]:
-            return [Move(0, 2), Move(1, 1), Move(2, 0)]
-        
+        x_mask = self.x_mask
+        o_mask = self.o_mask
+        for win, line in zip(WIN_MASKS, _WIN_LINES):
+            if (x_mask & win) == win or (o_mask & win) == win:
+                return line
+
         return None
-    
+
     def get_cell(self, x, y):
         """
         Get the value of a cell
-        
+
         Args:
             x (int): X coordinate
             y (int): Y coordinate
-            
+
         Returns:
             str: Cell value ('X', 'O', or '')
         """
         if not (0 <= x < 3 and 0 <= y < 3):
             raise ValueError(f"Coordinates ({x}, {y}) out of bounds")
-        
-        return self.grid[x][y]
+
+        bit = 1 << (x * 3 + y)
+        if self.x_mask & bit:
+            return 'X'
+        if self.o_mask & bit:
+            return 'O'
+        return ''
     
     def to_json(self):
         """
@@ -263,8 +391,9 @@ class Board:
         Returns:
             dict: JSON representation of the board
         """
+        # grid is a freshly built view, so no defensive copy is needed
         return {
-            'grid': [row[:] for row in self.grid]
+            'grid': self.grid
         }
     
     @classmethod
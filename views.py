@@ -1,82 +1,212 @@
 from django.shortcuts import render
-from django.http import JsonResponse
+from django.http import HttpResponse
+from django.utils.decorators import method_decorator
+from django.utils.safestring import mark_safe
+from django.views import View
 from django.views.decorators.csrf import csrf_exempt
 from django.contrib.auth.decorators import login_required
-import json
+from django.db import connection, transaction
+import gzip
+import hashlib
+import orjson
 
 from .models import Board, Move, UserPreference
 from .game_engine import GameEngine
 
 
+# Session key caching the preference fields for the logged-in user
+_PREFS_SESSION_KEY = 'user_prefs_cache'
+
+# Largest request body new_game will parse; the legitimate payload is
+# two short strings, so anything bigger is rejected unparsed
+_MAX_NEW_GAME_BODY = 1024
+
+_DIFFICULTIES = (
+    {'value': 'easy', 'label': 'Easy'},
+    {'value': 'medium', 'label': 'Medium'},
+    {'value': 'hard', 'label': 'Hard'},
+)
+
+# Static portion of the index context, built once and shared across
+# requests; difficulties_json is the same list pre-serialized so the
+# template can inline it without iterating and escaping per request
+_BASE_INDEX_CONTEXT = {
+    'title': 'Tic-Tac-Toe Game',
+    'difficulties': _DIFFICULTIES,
+    'difficulties_json': mark_safe(orjson.dumps(_DIFFICULTIES).decode())
+}
+
+
+class OrjsonResponse(HttpResponse):
+    """
+    JSON response serialized with orjson
+
+    Drop-in replacement for JsonResponse: orjson.dumps produces the
+    UTF-8 body bytes directly, skipping the intermediate str that
+    json.dumps builds and the re-encode on the WSGI path.
+    """
+
+    def __init__(self, data, **kwargs):
+        kwargs.setdefault('content_type', 'application/json')
+        super().__init__(orjson.dumps(data), **kwargs)
+
+
+# Memoized anonymous index page: (etag, body, gzipped body)
+_ANON_INDEX_CACHE = None
+
+
+def _anonymous_index(request):
+    """
+    Serve the index page for anonymous users
+
+    The page is identical for every anonymous visitor, so it is
+    rendered and gzip-compressed once per process. Repeat hits get a
+    304 on an ETag match or the precompressed body, with no template
+    or compression work per request.
+    """
+    global _ANON_INDEX_CACHE
+    cached = _ANON_INDEX_CACHE
+    if cached is None:
+        rendered = render(request, 'tictactoe/index.html', _BASE_INDEX_CONTEXT)
+        body = rendered.content
+        etag = '"%s"' % hashlib.md5(body).hexdigest()
+        cached = (etag, body, gzip.compress(body))
+        _ANON_INDEX_CACHE = cached
+
+    etag, body, gzipped = cached
+    if request.headers.get('If-None-Match') == etag:
+        response = HttpResponse(status=304)
+    elif 'gzip' in request.headers.get('Accept-Encoding', ''):
+        response = HttpResponse(gzipped, content_type='text/html; charset=utf-8')
+        response['Content-Encoding'] = 'gzip'
+    else:
+        response = HttpResponse(body, content_type='text/html; charset=utf-8')
+    response['ETag'] = etag
+    response['Vary'] = 'Accept-Encoding'
+    return response
+
+
 def index(request):
     """
     Main game page view
     """
+    # Anonymous requests get the cached pre-rendered page
+    if not request.user.is_authenticated:
+        return _anonymous_index(request)
+
+    # Logged-in users get their preferences — served from the session
+    # cache when possible so repeat page loads skip the query
+    cached = request.session.get(_PREFS_SESSION_KEY)
+    if cached is None or cached.get('user_id') != request.user.pk:
+        # Miss (or session reused across logins): hit the DB for the
+        # two fields the page uses, skipping model instantiation
+        prefs = (
+            UserPreference.objects
+            .filter(user=request.user)
+            .values('preferred_difficulty', 'preferred_mark')
+            .first()
+        )
+        if prefs is None:
+            # First visit: create the default preferences row
+            created, _ = UserPreference.objects.get_or_create(user=request.user)
+            prefs = {
+                'preferred_difficulty': created.preferred_difficulty,
+                'preferred_mark': created.preferred_mark
+            }
+        cached = {
+            'user_id': request.user.pk,
+            'difficulty': prefs['preferred_difficulty'],
+            'mark': prefs['preferred_mark']
+        }
+        request.session[_PREFS_SESSION_KEY] = cached
+
     context = {
-        'title': 'Tic-Tac-Toe Game',
-        'difficulties': [
-            {'value': 'easy', 'label': 'Easy'},
-            {'value': 'medium', 'label': 'Medium'},
-            {'value': 'hard', 'label': 'Hard'},
-        ]
+        **_BASE_INDEX_CONTEXT,
+        'user_preferences': {
+            'difficulty': cached['difficulty'],
+            'mark': cached['mark']
+        }
     }
-    
-    # If user is logged in, get their preferences
-    if request.user.is_authenticated:
-        try:
-            prefs = UserPreference.objects.get(user=request.user)
-            context['user_preferences'] = {
-                'difficulty': prefs.preferred_difficulty,
-                'mark': prefs.preferred_mark
-            }
-        except UserPreference.DoesNotExist:
-            # Create default preferences
-            prefs = UserPreference(user=request.user)
-            prefs.save()
-            context['user_preferences'] = {
-                'difficulty': prefs.preferred_difficulty,
-                'mark': prefs.preferred_mark
-            }
-    
     return render(request, 'tictactoe/index.html', context)
 
 
-@csrf_exempt
-def new_game(request):
+@method_decorator(csrf_exempt, name='dispatch')
+class NewGameView(View):
     """
     API endpoint to start a new game
+
+    Only POST is implemented; View.dispatch answers other methods with
+    405 itself, so the handler body carries no method checking.
     """
-    if request.method == 'POST':
+
+    def post(self, request):
+        # Bound worst-case parse CPU/memory before touching the JSON
+        if len(request.body) > _MAX_NEW_GAME_BODY:
+            return OrjsonResponse({
+                'success': False,
+                'error': 'Payload too large'
+            }, status=413)
+
+        # Only decoding and input validation can legitimately fail with
+        # user error; anything past this block is a server bug and goes
+        # through Django's normal 500 path instead of being masked.
+        # orjson.JSONDecodeError is a ValueError subclass, and
+        # AttributeError/TypeError cover non-object payloads.
         try:
-            data = json.loads(request.body)
+            data = orjson.loads(request.body)
             player_mark = data.get('player_mark', 'X')
             difficulty = data.get('difficulty', 'medium')
-            
-            # Create and store game engine in session
+
             game_engine = GameEngine()
             game_state = game_engine.start_new_game(
                 player_mark=player_mark,
                 difficulty=difficulty
             )
-            
-            # Store engine in session
-            request.session['game_engine'] = game_engine.__dict__
-            
-            # If user is authenticated, update preferences
-            if request.user.is_authenticated:
-                UserPreference.objects.update_or_create(
-                    user=request.user,
-                    defaults={
-                        'preferred_mark': player_mark,
-                        'preferred_difficulty': difficulty
-                    }
-                )
-            
-            return JsonResponse({
-                'success': True,
-                'game_state': game_state
-            })
-        except Exception as e:
-            return JsonResponse({
+        except (ValueError, TypeError, AttributeError) as e:
+            return OrjsonResponse({
                 'success': False,
-                'error
\ No newline at end of file
+                'error': str(e)
+            }, status=400)
+
+        # Store the compact engine state in the session
+        request.session['game_engine'] = game_engine.to_state()
+
+        # If user is authenticated, update preferences. The write
+        # and the session save share one transaction so both hit
+        # the backend in a single commit window.
+        if request.user.is_authenticated:
+            with transaction.atomic():
+                # The row usually exists already (index creates it),
+                # so try the single UPDATE first, INSERT on a miss
+                updated = UserPreference.objects.filter(user=request.user).update(
+                    preferred_mark=player_mark,
+                    preferred_difficulty=difficulty
+                )
+                if updated == 0:
+                    UserPreference.objects.create(
+                        user=request.user,
+                        preferred_mark=player_mark,
+                        preferred_difficulty=difficulty
+                    )
+                # Keep the session cache in step with the new values
+                request.session[_PREFS_SESSION_KEY] = {
+                    'user_id': request.user.pk,
+                    'difficulty': difficulty,
+                    'mark': player_mark
+                }
+                request.session.save()
+            # Already persisted; keep the session middleware from
+            # writing it a second time on response
+            request.session.modified = False
+
+        # ORM work is done; hand the connection back before response
+        # serialization so it is not held across the WSGI flush
+        connection.close()
+
+        return OrjsonResponse({
+            'success': True,
+            'game_state': game_state
+        })
+
+
+new_game = NewGameView.as_view()
\ No newline at end of file